@@ -6,7 +6,6 @@ from typing import Any, Dict, Optional
 
 import voluptuous as vol
 import aiohttp
-from bs4 import BeautifulSoup
 
 from homeassistant import config_entries
 from homeassistant.core import callback
@@ -23,6 +22,12 @@ from .const import (
     REQUEST_PARAMS,
     REQUEST_HEADERS,
 )
+from .street_index import (
+    InvalidAddressError,
+    async_get_street_index,
+    check_address,
+    normalize_address,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -47,21 +52,26 @@ class CannotConnectError(Exception):
     pass
 
 
-async def validate_input(hass, data: Dict[str, Any]) -> Dict[str, Any]:
+async def validate_input(
+    hass, data: Dict[str, Any], skip_street_checks: bool = False
+) -> Dict[str, Any]:
     """
     Validate the user input allows us to connect and find the address.
 
     Data has the keys from DATA_SCHEMA with values provided by the user.
+    The address is checked against the bundled street index first, so only
+    plausible addresses are looked up on the MKE website.
     """
+    # Raises InvalidAddressError without a network round-trip
+    index = await async_get_street_index(hass)
+    data = check_address(index, data, skip_street_checks)
+
     session = async_get_clientsession(hass)
 
     address_number = data[CONF_ADDRESS_NUMBER]
-    # Handle optional direction and suffix, ensure uppercase
-    street_direction = data.get(CONF_STREET_DIRECTION, "") or ""
-    street_direction = street_direction.upper()
-    street_name = data[CONF_STREET_NAME].upper()
-    street_suffix = data.get(CONF_STREET_SUFFIX, "") or ""
-    street_suffix = street_suffix.upper()
+    street_direction = data[CONF_STREET_DIRECTION]
+    street_name = data[CONF_STREET_NAME]
+    street_suffix = data[CONF_STREET_SUFFIX]
 
     post_params = {
         "laddr": address_number,
@@ -117,9 +127,15 @@ class MkeGarbageRecyclingConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
     CONNECTION_CLASS = config_entries.CONN_CLASS_CLOUD_POLL
 
+    def __init__(self) -> None:
+        """Initialize the config flow."""
+        # Normalized address last rejected by the street index
+        self._rejected_address: Optional[Dict[str, str]] = None
+
     async def async_step_user(self, user_input: Dict[str, Any] | None = None) -> Dict[str, Any]:
         """Handle the initial step."""
         errors: Dict[str, str] = {}
+        placeholders = {"url": BASE_URL, "streets": "", "directions": "", "suffixes": "", "house_numbers": ""}
 
         if user_input is not None:
             # Add empty string for direction and suffix if not provided by user (handles Optional fields)
@@ -127,8 +143,13 @@ class MkeGarbageRecyclingConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             user_input.setdefault(CONF_STREET_SUFFIX, "")
 
             try:
-                # Validate the user input with the external service
-                validated_data = await validate_input(self.hass, user_input)
+                # The street index may be wrong: resubmitting an address it
+                # rejected means the user insists it exists, so look it up anyway
+                submitted_address = normalize_address(user_input)
+                skip_street_checks = submitted_address == self._rejected_address
+
+                # Validate the user input locally, then with the external service
+                validated_data = await validate_input(self.hass, user_input, skip_street_checks)
                 formatted_address = validated_data["formatted_address"] # Get from validation result
 
                 # Create a unique ID based on the core address components to prevent duplicates
@@ -147,10 +168,22 @@ class MkeGarbageRecyclingConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 }
                 return self.async_create_entry(title=formatted_address, data=entry_data)
 
+            except InvalidAddressError as err:
+                errors.update(err.errors)
+                placeholders.update(err.placeholders)
+                self._rejected_address = submitted_address
             except CannotConnectError:
                 errors["base"] = "cannot_connect"
             except AddressNotFoundError:
                 errors["base"] = "address_not_found"
+                # Streets the index does not cover are only checked by the
+                # website, so offer similar indexed names once it has failed
+                index = await async_get_street_index(self.hass)
+                street_name = submitted_address[CONF_STREET_NAME]
+                if index.lookup(street_name) is None:
+                    placeholders["streets"] = ", ".join(index.suggest(street_name))
+                    if placeholders["streets"]:
+                        errors["base"] = "street_not_found"
             except config_entries.AbortFlow as err:
                  # AbortFlow is raised by _abort_if_unique_id_configured()
                  # We just re-raise it to stop the flow correctly
@@ -163,5 +196,5 @@ class MkeGarbageRecyclingConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         # Pre-fill the form with previous input if validation failed
         return self.async_show_form(
             step_id="user", data_schema=DATA_SCHEMA, errors=errors,
-            description_placeholders={"url": BASE_URL} # Optional: Can add placeholders to strings.yaml
+            description_placeholders=placeholders
         )
\ No newline at end of file
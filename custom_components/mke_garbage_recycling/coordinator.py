@@ -2,11 +2,11 @@
 
 import logging
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 import re
 import asyncio
 
 import aiohttp
-from bs4 import BeautifulSoup
 
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
@@ -29,6 +29,19 @@ _LOGGER = logging.getLogger(__name__)
 # Set a default update interval (e.g., every 6 hours)
 DEFAULT_SCAN_INTERVAL = timedelta(hours=6)
 
+WEEKDAYS = ["MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "FRIDAY", "SATURDAY", "SUNDAY"]
+
+
+@lru_cache(maxsize=None)
+def _date_patterns() -> tuple[re.Pattern[str], re.Pattern[str], re.Pattern[str]]:
+    """Compile the garbage, recycling and Clean & Green patterns on first use."""
+    # Note: Adjust regex if the website wording changes. Uses DOTALL to match across newlines.
+    return (
+        re.compile(r"next\s+(?:\w+\s+)?garbage\s+collection.*?<strong>(.*?)</strong>", re.IGNORECASE | re.DOTALL),
+        re.compile(r"next\s+(?:\w+\s+)?recycling\s+collection.*?<strong>(.*?)</strong>", re.IGNORECASE | re.DOTALL),
+        re.compile(r"Clean & Green Day:.*?pickup day is <b>(.*?)</b>", re.IGNORECASE | re.DOTALL),
+    )
+
 
 class MkeGarbageDataUpdateCoordinator(DataUpdateCoordinator[dict[str, date | None]]):
     """Class to manage fetching MKE garbage data."""
@@ -88,14 +101,8 @@ class MkeGarbageDataUpdateCoordinator(DataUpdateCoordinator[dict[str, date | Non
 
         # Parse the HTML content
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-
-            # Use regex on the text content for potentially better stability
-            # Note: Adjust regex if the website wording changes. Uses DOTALL to match across newlines.
-            # Compile regex patterns once (can be done outside function or as constants)
-            garbage_pattern = re.compile(r"next\s+(?:\w+\s+)?garbage\s+collection.*?<strong>(.*?)</strong>", re.IGNORECASE | re.DOTALL)
-            recycling_pattern = re.compile(r"next\s+(?:\w+\s+)?recycling\s+collection.*?<strong>(.*?)</strong>", re.IGNORECASE | re.DOTALL)
-            clean_green_pattern = re.compile(r"Clean & Green Day:.*?pickup day is <b>(.*?)</b>", re.IGNORECASE | re.DOTALL)
+            # Use regex on the raw HTML; no DOM parser is needed for these fields
+            garbage_pattern, recycling_pattern, clean_green_pattern = _date_patterns()
 
             garbage_match = garbage_pattern.search(html_content)
             recycling_match = recycling_pattern.search(html_content)
@@ -168,10 +175,9 @@ class MkeGarbageDataUpdateCoordinator(DataUpdateCoordinator[dict[str, date | Non
             pass
 
         # 5. Weekday Format: e.g. "WEDNESDAY" - calculate next occurrence of that weekday
-        weekdays = ["MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "FRIDAY", "SATURDAY", "SUNDAY"]
-        if cleaned_no_comma.upper() in weekdays:
+        if cleaned_no_comma.upper() in WEEKDAYS:
             try:
-                weekday_idx = weekdays.index(cleaned_no_comma.upper())
+                weekday_idx = WEEKDAYS.index(cleaned_no_comma.upper())
                 today = date.today()
                 days_ahead = weekday_idx - today.weekday()
                 if days_ahead < 0:
@@ -0,0 +1,255 @@
+# config/custom_components/mke_garbage_recycling/street_index.py
+
+import logging
+import asyncio
+import re
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    CONF_ADDRESS_NUMBER,
+    CONF_STREET_DIRECTION,
+    CONF_STREET_NAME,
+    CONF_STREET_SUFFIX,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+STREET_INDEX_FILE = Path(__file__).parent / "streets.txt"
+
+# Header line marking a street file generated from the city's full address list
+COMPLETE_MARKER = "# complete: true"
+
+# Numbered streets (27TH, 101ST, ...) are always fully listed in the index
+NUMBERED_STREET = re.compile(r"([0-9]+)[A-Z]*")
+
+# Limits for the suggestions shown back to the user
+MAX_SUGGESTIONS = 5
+CLOSE_MATCH_CUTOFF = 0.8
+
+_index: Optional["StreetIndex"] = None
+_index_lock = asyncio.Lock()
+
+
+class InvalidAddressError(Exception):
+    """Exception raised when an address is rejected by the local street index."""
+
+    def __init__(self, errors: Dict[str, str], placeholders: Optional[Dict[str, str]] = None) -> None:
+        """Store the form field errors and the placeholders their messages use."""
+        super().__init__(", ".join(f"{field}: {error}" for field, error in errors.items()))
+        self.errors = errors
+        self.placeholders = placeholders or {}
+
+
+class StreetEntry:
+    """Valid directions, suffixes and house-number ranges for one street name."""
+
+    __slots__ = ("name", "directions", "suffixes", "ranges")
+
+    def __init__(
+        self,
+        name: str,
+        directions: frozenset[str],
+        suffixes: frozenset[str],
+        ranges: Dict[str, Tuple[int, int]],
+    ) -> None:
+        """Initialize the street entry."""
+        self.name = name
+        self.directions = directions
+        self.suffixes = suffixes
+        self.ranges = ranges
+
+
+class StreetIndex:
+    """Sorted, in-memory index of Milwaukee street names."""
+
+    def __init__(self, entries: List[StreetEntry], complete: bool = False) -> None:
+        """Initialize the index from a list of street entries."""
+        entries = sorted(entries, key=lambda entry: entry.name)
+        self._names = [entry.name for entry in entries]
+        self._entries = entries
+        self.complete = complete
+
+    def __len__(self) -> int:
+        """Return the number of indexed streets."""
+        return len(self._names)
+
+    def lookup(self, name: str) -> Optional[StreetEntry]:
+        """Return the entry for an exact (uppercase) street name, if indexed."""
+        pos = bisect_left(self._names, name)
+        if pos < len(self._names) and self._names[pos] == name:
+            return self._entries[pos]
+        return None
+
+    def covers(self, name: str) -> bool:
+        """Return True if a name missing from the index cannot be a real street."""
+        return self.complete or NUMBERED_STREET.fullmatch(name) is not None
+
+    def prefix_matches(self, prefix: str, limit: int = MAX_SUGGESTIONS) -> List[str]:
+        """Return up to `limit` street names starting with `prefix`."""
+        if not prefix:
+            return []
+        matches = []
+        pos = bisect_left(self._names, prefix)
+        while pos < len(self._names) and len(matches) < limit:
+            if not self._names[pos].startswith(prefix):
+                break
+            matches.append(self._names[pos])
+            pos += 1
+        return matches
+
+    def suggest(self, name: str, limit: int = MAX_SUGGESTIONS) -> List[str]:
+        """Return likely intended street names for a misspelled or partial name."""
+        # Only needed on the typo path, so keep it out of the module import
+        from difflib import get_close_matches
+
+        suggestions = []
+        numbered = NUMBERED_STREET.fullmatch(name)
+        if numbered and self.lookup(_ordinal(int(numbered.group(1)))):
+            # e.g. "21TH" or "21" -> "21ST"
+            suggestions.append(_ordinal(int(numbered.group(1))))
+        candidates = get_close_matches(name, self._names, n=limit, cutoff=CLOSE_MATCH_CUTOFF)
+        candidates += self.prefix_matches(name, limit)
+        for match in candidates:
+            if len(suggestions) >= limit:
+                break
+            if match not in suggestions:
+                suggestions.append(match)
+        return suggestions
+
+
+def _ordinal(number: int) -> str:
+    """Return the street-style ordinal for a number, e.g. 21 -> '21ST'."""
+    if 10 <= number % 100 <= 20:
+        return f"{number}TH"
+    return str(number) + {1: "ST", 2: "ND", 3: "RD"}.get(number % 10, "TH")
+
+
+def _parse_directions(value: str) -> frozenset[str]:
+    """Parse a direction column such as 'EW', where '-' stands for no direction."""
+    return frozenset("" if direction == "-" else direction for direction in value.strip())
+
+
+def _parse_suffixes(value: str) -> frozenset[str]:
+    """Parse a suffix column such as 'ST PL', where '-' stands for no suffix."""
+    return frozenset("" if suffix == "-" else suffix for suffix in value.split())
+
+
+def _parse_ranges(value: str) -> Dict[str, Tuple[int, int]]:
+    """Parse 'DIR:LOW-HIGH' house-number ranges, where '-' stands for no direction."""
+    ranges: Dict[str, Tuple[int, int]] = {}
+    for item in value.split():
+        direction, _, bounds = item.partition(":")
+        low, _, high = bounds.partition("-")
+        ranges["" if direction == "-" else direction] = (int(low), int(high))
+    return ranges
+
+
+def load_street_index(path: Path = STREET_INDEX_FILE) -> StreetIndex:
+    """Load the street index from disk. Blocking; run in the executor."""
+    entries = []
+    complete = False
+    with open(path, encoding="utf-8") as handle:
+        for line in handle:
+            line = line.strip()
+            if line == COMPLETE_MARKER:
+                complete = True
+            if not line or line.startswith("#"):
+                continue
+            columns = line.split("|")
+            entries.append(
+                StreetEntry(
+                    name=columns[0].strip(),
+                    directions=_parse_directions(columns[1]),
+                    suffixes=_parse_suffixes(columns[2]),
+                    ranges=_parse_ranges(columns[3]) if len(columns) > 3 else {},
+                )
+            )
+    _LOGGER.debug("Loaded %d streets from %s (complete: %s)", len(entries), path, complete)
+    return StreetIndex(entries, complete)
+
+
+async def async_get_street_index(hass: HomeAssistant) -> StreetIndex:
+    """Return the street index, loading it on first use."""
+    global _index
+    if _index is None:
+        async with _index_lock:
+            if _index is None:
+                _index = await hass.async_add_executor_job(load_street_index)
+    return _index
+
+
+def normalize_address(data: Dict[str, Any]) -> Dict[str, str]:
+    """Return the address fields stripped and uppercased, as they are submitted."""
+    return {
+        CONF_ADDRESS_NUMBER: str(data[CONF_ADDRESS_NUMBER]).strip(),
+        CONF_STREET_DIRECTION: (data.get(CONF_STREET_DIRECTION, "") or "").upper(),
+        CONF_STREET_NAME: " ".join(data[CONF_STREET_NAME].upper().split()),
+        CONF_STREET_SUFFIX: (data.get(CONF_STREET_SUFFIX, "") or "").upper(),
+    }
+
+
+def check_address(
+    index: StreetIndex, data: Dict[str, Any], skip_street_checks: bool = False
+) -> Dict[str, str]:
+    """
+    Check an address against the street index without touching the network.
+
+    Returns the normalized address. Raises InvalidAddressError with every
+    failed check for the address: a malformed house number always, and unless
+    `skip_street_checks` is set, an unknown street name (where the index is
+    known to list every street), or a direction, suffix or house number the
+    index does not list for the street. A blank direction or suffix is never
+    filled in; when the street has a single choice it is offered instead.
+    The flow lets the user override the street checks by resubmitting.
+    """
+    address = normalize_address(data)
+    address_number = address[CONF_ADDRESS_NUMBER]
+    street_direction = address[CONF_STREET_DIRECTION]
+    street_name = address[CONF_STREET_NAME]
+    street_suffix = address[CONF_STREET_SUFFIX]
+
+    if not address_number.isdecimal() or not address_number.isascii() or int(address_number) == 0:
+        raise InvalidAddressError({CONF_ADDRESS_NUMBER: "invalid_address_number"})
+
+    if skip_street_checks:
+        return address
+
+    errors: Dict[str, str] = {}
+    placeholders: Dict[str, str] = {}
+
+    entry = index.lookup(street_name)
+    if entry is None:
+        if index.covers(street_name):
+            errors[CONF_STREET_NAME] = "unknown_street"
+            placeholders["streets"] = ", ".join(index.suggest(street_name)) or "-"
+            raise InvalidAddressError(errors, placeholders)
+        return address
+
+    directions = sorted(d for d in entry.directions if d)
+    if street_direction not in entry.directions:
+        if not directions:
+            errors[CONF_STREET_DIRECTION] = "no_direction"
+        else:
+            errors[CONF_STREET_DIRECTION] = "missing_direction" if not street_direction else "invalid_direction"
+            placeholders["directions"] = ", ".join(directions)
+
+    suffixes = sorted(s for s in entry.suffixes if s)
+    if street_suffix not in entry.suffixes:
+        if not suffixes:
+            errors[CONF_STREET_SUFFIX] = "no_suffix"
+        else:
+            errors[CONF_STREET_SUFFIX] = "missing_suffix" if not street_suffix else "invalid_suffix"
+            placeholders["suffixes"] = ", ".join(suffixes)
+
+    bounds = entry.ranges.get(street_direction)
+    if bounds and not bounds[0] <= int(address_number) <= bounds[1]:
+        errors[CONF_ADDRESS_NUMBER] = "address_out_of_range"
+        placeholders["house_numbers"] = f"{bounds[0]}-{bounds[1]}"
+
+    if errors:
+        raise InvalidAddressError(errors, placeholders)
+    return address
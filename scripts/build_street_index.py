@@ -0,0 +1,87 @@
+"""Build the bundled street index from the City of Milwaukee Master Address Index.
+
+Download the Master Address Index (MAI) CSV from https://data.milwaukee.gov
+and run:
+
+    python3 scripts/build_street_index.py MAI.csv
+
+This rewrites custom_components/mke_garbage_recycling/streets.txt with every
+street in the city, its directions, suffixes and house-number range per
+direction, and marks the file as complete so the config flow rejects unknown
+street names locally.
+"""
+import argparse
+import csv
+from collections import defaultdict
+from datetime import date
+from pathlib import Path
+
+STREETS_FILE = Path(__file__).resolve().parent.parent / "custom_components" / "mke_garbage_recycling" / "streets.txt"
+
+HEADER = """# Bundled Milwaukee street index used by the config flow for local address checks.
+# complete: true
+# source: City of Milwaukee Master Address Index ({source}, built {built})
+#
+# One street per line: NAME|DIRECTIONS|SUFFIXES|RANGES
+#   DIRECTIONS  valid prefix directions (N, S, E, W), "-" for none
+#   SUFFIXES    space-separated valid suffixes, "-" for none
+#   RANGES      space-separated DIR:LOW-HIGH house-number ranges, "-" for no direction
+#
+# Generated by scripts/build_street_index.py; do not edit by hand.
+"""
+
+
+def build(rows, number_col, direction_col, name_col, suffix_col):
+    """Collect directions, suffixes and house-number ranges per street name."""
+    streets = defaultdict(lambda: {"directions": set(), "suffixes": set(), "ranges": {}})
+    for row in rows:
+        name = " ".join((row.get(name_col) or "").upper().split())
+        number = (row.get(number_col) or "").strip()
+        if not name or not number.isdecimal():
+            continue
+        direction = (row.get(direction_col) or "").strip().upper()
+        street = streets[name]
+        street["directions"].add(direction)
+        street["suffixes"].add((row.get(suffix_col) or "").strip().upper())
+        low, high = street["ranges"].get(direction, (int(number), int(number)))
+        street["ranges"][direction] = (min(low, int(number)), max(high, int(number)))
+    return streets
+
+
+def format_line(name, street):
+    """Format one street as a streets.txt line."""
+    directions = "".join(sorted(direction or "-" for direction in street["directions"]))
+    suffixes = " ".join(sorted(suffix or "-" for suffix in street["suffixes"]))
+    ranges = " ".join(
+        f"{direction or '-'}:{low}-{high}" for direction, (low, high) in sorted(street["ranges"].items())
+    )
+    return f"{name}|{directions}|{suffixes}|{ranges}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("csv_file", type=Path, help="Master Address Index CSV export")
+    parser.add_argument("--number-column", default="HSE_NBR")
+    parser.add_argument("--direction-column", default="DIR")
+    parser.add_argument("--name-column", default="STREET")
+    parser.add_argument("--suffix-column", default="STTYPE")
+    parser.add_argument("--output", type=Path, default=STREETS_FILE)
+    args = parser.parse_args()
+
+    with open(args.csv_file, newline="", encoding="utf-8-sig") as handle:
+        streets = build(
+            csv.DictReader(handle),
+            args.number_column, args.direction_column, args.name_column, args.suffix_column,
+        )
+    if not streets:
+        parser.error(f"no streets found in {args.csv_file}; check the column names")
+
+    with open(args.output, "w", encoding="utf-8") as handle:
+        handle.write(HEADER.format(source=args.csv_file.name, built=date.today().isoformat()))
+        for name in sorted(streets):
+            handle.write(format_line(name, streets[name]) + "\n")
+    print(f"Wrote {len(streets)} streets to {args.output}")
+
+
+if __name__ == "__main__":
+    main()